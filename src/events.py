@@ -1,13 +1,21 @@
-from enum import Enum
+import heapq
+import itertools
+import math
+from enum import IntEnum
 from dataclasses import dataclass
-from typing import Any
+from typing import Any, List, Sequence, Tuple
 
-class EventType(Enum):
-    ARRIVAL = 1,
-    DEPARTURE = 2,
-    STOP = 3
+_heappush = heapq.heappush
+_heappop = heapq.heappop
 
-@dataclass
+class EventType(IntEnum):
+    # IntEnum members are ints: they compare in C and double as
+    # indexes into main's handler table
+    ARRIVAL = 0
+    DEPARTURE = 1
+    STOP = 2
+
+@dataclass(slots=True)
 class Event:
     time: float
     event_type: EventType
@@ -21,6 +29,47 @@ class Event:
     # Default is -1 to indicate 'not applicable' for Arrivals.
     server_index: int = -1
 
-    def __lt__(self, other):
-        return self.time < other.time
 
+class TwoPartQueue:
+    """
+    Event queue split into a static and a dynamic part.
+
+    The arrival stream does not depend on the state of the system, so it is
+    generated up front and read through a cursor over a sorted array.
+    Only DEPARTURE events go into an actual heap - and every server has at
+    most one outstanding departure, so that heap never holds more than M events
+    (plus the STOP event).
+    """
+
+    def __init__(self, arrival_times: Sequence[float], event_pool):
+        self._arrivals = arrival_times
+        self._arrival_count = len(arrival_times)
+        self._cursor = 0
+        self._get_event = event_pool.get  # Bound once - pop() runs for every event
+        # Heap entries are (time, tiebreak, event) tuples, so sifting compares
+        # floats in C and never has to look at the Event itself.
+        self._departures: List[Tuple[float, int, Event]] = []
+        self._next_tiebreak = itertools.count().__next__
+
+    def push(self, event: Event, _heappush=_heappush):
+        """Schedules a DEPARTURE event (arrivals are already known)."""
+        _heappush(self._departures, (event.time, self._next_tiebreak(), event))
+
+    def push_stop(self, event: Event):
+        """
+        Schedules the STOP event. Its infinite tiebreak sorts it after any
+        departure at the same time, so departures at exactly T are still processed.
+        """
+        _heappush(self._departures, (event.time, math.inf, event))
+
+    def pop(self, _ARRIVAL=EventType.ARRIVAL, _heappop=_heappop) -> Event:
+        departures = self._departures
+        cursor = self._cursor
+        if cursor < self._arrival_count:
+            arrival_time = self._arrivals[cursor]
+            # Arrivals win ties, so an arrival at exactly T is still processed before STOP
+            if not departures or arrival_time <= departures[0][0]:
+                self._cursor = cursor + 1
+                return self._get_event(arrival_time, _ARRIVAL)
+
+        return _heappop(departures)[2]
@@ -1,14 +1,20 @@
 import sys
 from dataclasses import dataclass
 from typing import List
-import heapq
 import random
+from array import array
 
-from events import Event, EventType
-from network import Server, LoadBalancer, Request
+from events import Event, EventType, TwoPartQueue
+from network import Server, LoadBalancer
+from pools import EventPool, RequestPool
 from stats import StatsCollector
 
-@dataclass
+# Hot-path names, bound once so the event handlers load them as locals
+# (via default arguments) instead of doing global/attribute lookups per event.
+_expovariate = random.expovariate
+_DEPARTURE = EventType.DEPARTURE
+
+@dataclass(slots=True)
 class SimulationConfig:
     """Holds the validated configuration for a simulation run."""
     max_time: float      # T
@@ -90,66 +96,65 @@ def parse_args(args: List[str]) -> SimulationConfig:
         print("Error: Argument list mismatch. Check your M value vs the provided lists.")
         sys.exit(1)
 
-def handle_arrival(event: Event, config, load_balancer, event_queue, stats):
+def generate_arrivals(arrival_rate: float, max_time: float) -> array:
+    """
+    Pre-generates the whole Poisson arrival stream up to T.
+    Returns the (sorted) arrival times as a compact array of doubles.
+    """
+    arrivals = array('d')
+    arrival_time = _expovariate(arrival_rate)
+
+    while arrival_time <= max_time:
+        arrivals.append(arrival_time)
+        arrival_time += _expovariate(arrival_rate)
+
+    return arrivals
+
+def handle_arrival(event: Event, config, load_balancer, event_queue, stats, event_pool, request_pool,
+                   _expovariate=_expovariate, _DEPARTURE=_DEPARTURE):
     """
-    Generates the NEXT arrival (Self-Scheduling).
     Routes the CURRENT arrival to a server.
+    The arrivals themselves were generated up front (see generate_arrivals).
     """
     current_time = event.time
     
-    # --- Schedule Next Arrival (The Chain Reaction) ---
-    # We always schedule the next arrival first to keep the stream alive.
-    next_interval = random.expovariate(config.arrival_rate)
-    next_arrival_time = current_time + next_interval
-    
-    # We stop creating NEW arrivals if time exceeds T
-    if next_arrival_time <= config.max_time:
-        next_event = Event(
-            time=next_arrival_time,
-            event_type=EventType.ARRIVAL,
-            payload=None
-        )
-        heapq.heappush(event_queue, next_event)
-        
     # --- Process Current Request ---
     # Create the request object
-    req = Request(id=stats.get_next_id(), arrival_time=current_time, service_start_time=None, service_duration=None)
+    req_id = stats._arrival_counter
+    stats._arrival_counter = req_id + 1
+    req = request_pool.get(req_id, current_time)
     
     accepted, server = load_balancer.assign_request(req)
     
     if not accepted:
-        stats.log_drop()
+        stats.dropped_requests += 1
+        request_pool.release(req)
         return
 
     # Case: Accepted
+    # Draw the service time once, up front - it is the same Exp(Mu_i) draw whether
+    # service starts now or when the request leaves the queue.
+    req.service_duration = _expovariate(server.service_rate)
+
     # Now check: Did it start service IMMEDIATELY?
     # If the server took it and was idle, it is now BUSY and we must schedule its departure.
     # We identify this by checking if the request we just sent is the one currently in service.
     
-    if server.current_request == req:
+    if server.current_request is req:
         # It skipped the queue!
         req.service_start_time = current_time # Wait time = 0
+        departure_time = current_time + req.service_duration
         
-        # Calculate Service Duration (Exponential)
-        service_duration = random.expovariate(server.service_rate)
-        req.service_duration = service_duration
-        
-        departure_time = current_time + service_duration
-        
-        if departure_time <= config.max_time:
-            # Schedule Departure
-            dep_event = Event(
-                time=departure_time,
-                event_type=EventType.DEPARTURE,
-                payload=req,
-                server_index=server.id
-            )
-            heapq.heappush(event_queue, dep_event)
+        # Schedule Departure
+        # (departures after T are never reached: the STOP event at T comes first)
+        dep_event = event_pool.get(departure_time, _DEPARTURE, req, server.id)
+        event_queue.push(dep_event)
         
     # If it went into the queue, we do NOT schedule a departure yet. 
     # It will be scheduled later, when the server finishes the previous job.
 
-def handle_departure(event: Event, config, load_balancer, event_queue, stats):
+def handle_departure(event: Event, config, load_balancer, event_queue, stats, event_pool, request_pool,
+                     _DEPARTURE=_DEPARTURE):
     """
     Handles the completion of a request at a specific server.
     """
@@ -157,19 +162,26 @@ def handle_departure(event: Event, config, load_balancer, event_queue, stats):
     
     # 1. Retrieve Context
     # We use the server_index stored in the event to find the right server object
-    server = load_balancer.servers[event.server_index]
+    idx = event.server_index
+    server = load_balancer.servers[idx]
     finished_req = event.payload
     
-    # 2. Update Statistics (for the request that just finished)    
-    wait_time = finished_req.service_start_time - finished_req.arrival_time
-    service_time = finished_req.service_duration
-    
-    stats.log_departure(wait_time, service_time, current_time)
+    # 2. Update Statistics (for the request that just finished)
+    # Updates A, Tw sums, Ts sums, and Tend.
+    stats.served_requests += 1
+    stats.total_wait_time += finished_req.service_start_time - finished_req.arrival_time
+    stats.total_service_time += finished_req.service_duration
+
+    # Time is monotonic, so the last departure processed is by definition the latest one.
+    stats.last_departure_time = current_time
+    request_pool.release(finished_req)
     
     # 3. Check for Next Job
-    if server.queue:
+    qlen = load_balancer.qlen
+    if qlen[idx]:
         # --- SCENARIO A: There is work in the queue ---
         # The server remains BUSY. We immediately pull the next request.
+        qlen[idx] -= 1
         next_req = server.queue.popleft()
         
         # Update Server State
@@ -178,28 +190,16 @@ def handle_departure(event: Event, config, load_balancer, event_queue, stats):
         # Mark the start of service for this new request
         next_req.service_start_time = current_time
         
-        # Calculate Service Duration (Exponential Randomness)
-        # Note: We generate this NOW, as the service actually begins NOW.
-        service_duration = random.expovariate(server.service_rate)
-        next_req.service_duration = service_duration
-        
         # Schedule the FUTURE Departure
-        departure_time = current_time + service_duration
-        
-        if departure_time <= config.max_time:
-            # Schedule Departure
-            new_event = Event(
-                time=departure_time,
-                event_type=EventType.DEPARTURE,
-                payload=next_req,
-                server_index=server.id
-            )
-            heapq.heappush(event_queue, new_event)
+        # (its service duration was already drawn on arrival)
+        departure_time = current_time + next_req.service_duration
+        new_event = event_pool.get(departure_time, _DEPARTURE, next_req, server.id)
+        event_queue.push(new_event)
         
     else:
         # --- SCENARIO B: The queue is empty ---
         # The server has nothing to do.
-        server.is_busy = False
+        load_balancer.busy[idx] = False
         server.current_request = None
 
 def main():
@@ -207,32 +207,32 @@ def main():
     servers = [Server(i, config.service_rates[i], config.queue_sizes[i]) for i in range(config.server_count)]
     load_balancer = LoadBalancer(servers, config.probabilities)
     stats = StatsCollector()
-    current_time = 0.0
-    event_queue = []
-    first_interval = random.expovariate(config.arrival_rate)
-    first_arrival_time = current_time + first_interval
-    
-    if first_arrival_time <= config.max_time:
-        first_event = Event(
-            time=first_arrival_time, 
-            event_type=EventType.ARRIVAL, 
-            payload=None
-        )
-        heapq.heappush(event_queue, first_event)
+    event_pool = EventPool()
+    request_pool = RequestPool()
+    event_queue = TwoPartQueue(generate_arrivals(config.arrival_rate, config.max_time), event_pool)
 
-    while event_queue:
-        current_event = heapq.heappop(event_queue)
-        
-        # Update the Global Clock
-        current_time = current_event.time
+    pop_event = event_queue.pop
+    release_event = event_pool.release
+
+    # Indexed by EventType. Both handlers take the same arguments.
+    handlers = (handle_arrival, handle_departure)
+
+    # The simulation ends at T: nothing scheduled after the STOP event is processed
+    stop_event = Event(time=config.max_time, event_type=EventType.STOP)
+    event_queue.push_stop(stop_event)
+
+    while True:
+        current_event = pop_event()
+        if current_event is stop_event:
+            break
         
-        if current_event.event_type == EventType.ARRIVAL:
-            handle_arrival(current_event, config, load_balancer, event_queue, stats)
-            
-        elif current_event.event_type == EventType.DEPARTURE:
-            handle_departure(current_event, config, load_balancer, event_queue, stats)
+        # Each handler reads the clock from its own event (event.time)
+        handlers[current_event.event_type](current_event, config, load_balancer, event_queue, stats,
+                                           event_pool, request_pool)
+
+        # The handlers are done with it - recycle the event object
+        release_event(current_event)
 
-    # Simulation ends when event queue is empty
     stats.print_report()
 
 if __name__ == "__main__":
@@ -3,7 +3,7 @@ import random
 from dataclasses import dataclass
 from typing import List, Deque, Optional, Tuple
 
-@dataclass
+@dataclass(slots=True)
 class Request:
     id: int
     arrival_time: int
@@ -11,65 +11,93 @@ class Request:
     service_duration: int
 
 class Server:
+    __slots__ = ('id', 'service_rate', 'max_queue_size', 'queue', 'current_request')
+
     def __init__(self, server_id: int, service_rate: float, max_queue_size: int):
             self.id = server_id
             self.service_rate = service_rate  # Mu
             self.max_queue_size = max_queue_size  # Q_i
             
             # State
-            self.is_busy: bool = False
+            # Busy flag and queue length live in the LoadBalancer's per-server arrays.
             self.queue: Deque[Request] = collections.deque()
             self.current_request: Optional[Request] = None
-
-    def can_accept(self) -> bool:
-        """
-        Checks if the server can accept a new request.
-        A server rejects only if it is BUSY AND its Queue is FULL.
-        """
-        if not self.is_busy:
-            return True
-        
-        # [cite_start]Note: max_queue_size excludes the one in service [cite: 37]
-        return len(self.queue) < self.max_queue_size
-
-    def add_request(self, req: Request) -> bool:
-        """
-        Tries to accept the request.
-        Returns True if accepted (either served or queued).
-        Returns False if dropped (full).
-        """
-        # Case 1: Server is Idle -> Goes directly to service
-        if not self.is_busy:
-            self.is_busy = True
-            self.current_request = req
-            return True # Accepted (Immediate Service)
-            
-        # Case 2: Server Busy, but Queue has space
-        if len(self.queue) < self.max_queue_size:
-            self.queue.append(req)
-            return True # Accepted (Queued)
-            
-        # Case 3: Full
-        return False # Dropped
             
 class LoadBalancer:
     def __init__(self, servers: List[Server], probabilities: List[float]):
         self.servers = servers
         self.probabilities = probabilities
-        
+        self._servers_tuple = tuple(servers)
+
+        # Server state as parallel arrays (one slot per server), so admission
+        # checks are plain list loads and aggregates need no loop over objects.
+        self.busy: List[bool] = [False] * len(servers)
+        self.qlen: List[int] = [0] * len(servers)  # Waiting requests (excludes the one in service)
+        self.qcap: List[int] = [server.max_queue_size for server in servers]  # Q_i
+        self._prob, self._alias = self._build_alias_table(probabilities)
+
+    @staticmethod
+    def _build_alias_table(probabilities: List[float]) -> Tuple[List[float], List[int]]:
+        """
+        Builds the tables for Vose's alias method, so that drawing a server
+        costs O(1) instead of re-accumulating the weights on every draw.
+        """
+        count = len(probabilities)
+        total = sum(probabilities)
+        scaled = [p * count / total for p in probabilities]
+
+        prob = [0.0] * count
+        alias = list(range(count))
+        small = [i for i, p in enumerate(scaled) if p < 1.0]
+        large = [i for i, p in enumerate(scaled) if p >= 1.0]
+
+        while small and large:
+            less = small.pop()
+            more = large.pop()
+            prob[less] = scaled[less]
+            alias[less] = more
+
+            # 'more' donated the rest of less's column
+            scaled[more] = scaled[more] + scaled[less] - 1.0
+            if scaled[more] < 1.0:
+                small.append(more)
+            else:
+                large.append(more)
+
+        # Whatever is left is (up to rounding) exactly one full column
+        for i in large + small:
+            prob[i] = 1.0
+
+        return prob, alias
+
     def assign_request(self, request: Request) -> Tuple[bool, Optional[Server]]:
         """
         1. Selects a server based on weighted probability P_i.
         2. Tries to push the request to that server.
+           A server rejects only if it is BUSY AND its Queue is FULL.
         
         Returns:
             (True, server_obj) if accepted.
             (False, None) if dropped.
         """
-        selected_server = random.choices(self.servers, self.probabilities, k=1)[0]
-        accepted = selected_server.add_request(request)
-    
-        if accepted:
+        # One uniform draw picks both the column (integer part) and the coin flip (fraction)
+        u = random.random() * len(self._prob)
+        i = int(u)
+        idx = i if u - i < self._prob[i] else self._alias[i]
+        selected_server = self._servers_tuple[idx]
+
+        # Case 1: Server is Idle -> Goes directly to service
+        if not self.busy[idx]:
+            self.busy[idx] = True
+            selected_server.current_request = request
             return True, selected_server
-        else:
-            return False, None
\ No newline at end of file
+
+        # Case 2: Server Busy, but Queue has space
+        # Note: the queue capacity excludes the one in service
+        if self.qlen[idx] < self.qcap[idx]:
+            self.qlen[idx] += 1
+            selected_server.queue.append(request)
+            return True, selected_server
+
+        # Case 3: Full -> Dropped
+        return False, None
\ No newline at end of file
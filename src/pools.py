@@ -0,0 +1,54 @@
+from typing import Any, List, Optional
+
+from events import Event, EventType
+from network import Request
+
+class EventPool:
+    """
+    Free list of retired Event objects.
+    Events are handed back explicitly with release() once processed, so the
+    event loop keeps recycling a handful of objects instead of allocating new ones.
+    """
+    __slots__ = ('_free',)
+
+    def __init__(self):
+        self._free: List[Event] = []
+
+    def get(self, time: float, event_type: EventType, payload: Any = None, server_index: int = -1) -> Event:
+        """Returns a recycled Event (or a new one if the pool is empty) set to the given fields."""
+        if not self._free:
+            return Event(time, event_type, payload, server_index)
+
+        event = self._free.pop()
+        event.time = time
+        event.event_type = event_type
+        event.payload = payload
+        event.server_index = server_index
+        return event
+
+    def release(self, event: Event):
+        """Returns a processed event to the pool. The caller must not use it afterwards."""
+        event.payload = None  # Don't keep the request alive through the pool
+        self._free.append(event)
+
+class RequestPool:
+    """Free list of retired Request objects (see EventPool)."""
+    __slots__ = ('_free',)
+
+    def __init__(self):
+        self._free: List[Request] = []
+
+    def get(self, req_id: int, arrival_time: float,
+            service_start_time: Optional[float] = None, service_duration: Optional[float] = None) -> Request:
+        if not self._free:
+            return Request(req_id, arrival_time, service_start_time, service_duration)
+
+        req = self._free.pop()
+        req.id = req_id
+        req.arrival_time = arrival_time
+        req.service_start_time = service_start_time
+        req.service_duration = service_duration
+        return req
+
+    def release(self, req: Request):
+        self._free.append(req)
@@ -1,17 +1,28 @@
+import collections
+import csv
+import math
 import random
-import heapq
 import sys
+from concurrent.futures import ProcessPoolExecutor
+
+def main(arrival_rate, service_rate, simulation_time, max_queue_size, seed=None):
+    """
+    Simulates an M/M/1/K queue.
+    Returns (num_customers_served, num_not_served, average_wait_time).
+    """
+    rng = random.Random(seed)
+    expovariate = rng.expovariate
 
-def main(arrival_rate, service_rate, simulation_time, max_queue_size):
     # Events
-    ARRIVAL = 1
-    DEPARTURE = 2
+    # There is at most one pending arrival and one pending departure,
+    # so the event list is just their two times (inf = not scheduled).
+    next_arrival = expovariate(arrival_rate)
+    next_departure = math.inf
 
     # State variables
     current_time = 0.0
-    queue = []
+    queue = collections.deque()  # Arrival times of the waiting customers (ring buffer)
     server_busy = False
-    event_list = []
 
     # Statistics
     total_wait_time = 0.0
@@ -19,49 +30,69 @@ def main(arrival_rate, service_rate, simulation_time, max_queue_size):
     num_customers_rejected = 0
     num_customers_arrived = 0
 
-    # Schedule the first arrival
-    heapq.heappush(event_list, (random.expovariate(arrival_rate), ARRIVAL))
-
     while current_time < simulation_time:
-        event_time, event_type = heapq.heappop(event_list)
-        current_time = event_time
-        
-        if event_type == ARRIVAL:
+        # Arrivals win ties, just like (time, ARRIVAL) < (time, DEPARTURE) would
+        if next_arrival <= next_departure:
+            current_time = next_arrival
             num_customers_arrived += 1
             if not server_busy:
                 server_busy = True
-                service_time = random.expovariate(service_rate)
-                heapq.heappush(event_list, (current_time + service_time, DEPARTURE))
+                next_departure = current_time + expovariate(service_rate)
             else:
                 if len(queue) < max_queue_size:
                     queue.append(current_time)
                 else:
                     num_customers_rejected += 1
-            next_arrival = current_time + random.expovariate(arrival_rate)
-            heapq.heappush(event_list, (next_arrival, ARRIVAL))
-        elif event_type == DEPARTURE:
+            next_arrival = current_time + expovariate(arrival_rate)
+        else:
+            current_time = next_departure
             num_customers_served += 1
             if queue:
-                arrival_time = queue.pop(0)
+                arrival_time = queue.popleft()
                 wait_time = current_time - arrival_time
                 total_wait_time += wait_time
-                service_time = random.expovariate(service_rate)
-                heapq.heappush(event_list, (current_time + service_time, DEPARTURE))
+                next_departure = current_time + expovariate(service_rate)
             else:
                 server_busy = False
+                next_departure = math.inf
 
     # Count customers still in queue as not served
     num_not_served = num_customers_rejected + len(queue)
+    average_wait_time = total_wait_time / num_customers_served if num_customers_served > 0 else 0
 
-    # Results
-    print(f"Number of customers served: {num_customers_served}")
-    print(f"Number of customers not served: {num_not_served}")
-    print(f"Average wait time: {total_wait_time / num_customers_served if num_customers_served > 0 else 0}")
+    return num_customers_served, num_not_served, average_wait_time
+
+def _run_replication(args):
+    """Unpacks one (arrival_rate, service_rate, simulation_time, max_queue_size, seed) job for the process pool."""
+    return main(*args)
+
+def run_batch(arrival_rate, service_rate, sim_times, max_queue_size, num_runs, output_path="simulation_results.csv"):
+    """
+    Runs num_runs independent replications for every simulation time in sim_times
+    and writes one CSV row per replication.
+    The replications are spread over all CPU cores; each one gets its own seed.
+    """
+    jobs = [(sim_time, run) for sim_time in sim_times for run in range(1, num_runs + 1)]
+    seeds = [random.randrange(2 ** 32) for _ in jobs]
+    args = [(arrival_rate, service_rate, sim_time, max_queue_size, seed)
+            for (sim_time, _), seed in zip(jobs, seeds)]
+
+    # Finish every replication before touching the output file, so a failed or
+    # interrupted batch leaves the previous results intact.
+    with ProcessPoolExecutor() as executor:
+        results = list(executor.map(_run_replication, args, chunksize=max(1, len(args) // 64)))
+
+    with open(output_path, "w", newline="") as csvfile:
+        writer = csv.writer(csvfile)
+        writer.writerow(["simulation_time", "run", "customers_served", "customers_not_served", "average_wait_time"])
+        writer.writerows((sim_time, run, served, not_served, avg_wait)
+                         for (sim_time, run), (served, not_served, avg_wait) in zip(jobs, results))
 
 if __name__ == "__main__":
-    if len(sys.argv) != 5:
+    if len(sys.argv) not in (5, 6):
         print("Error: Invalid number of arguments")
-        print("Usage: python question1.py <arrival_rate> <service_rate> <simulation_time> <max_queue_size>")
+        print("Usage: python question1.py <arrival_rate> <service_rate> <simulation_time> <max_queue_size> [num_runs]")
+        print("With num_runs, every multiple of 10 up to simulation_time is run num_runs times into simulation_results.csv")
         sys.exit(1)
     
     try:
@@ -69,8 +100,25 @@ if __name__ == "__main__":
         service_rate = float(sys.argv[2])
         simulation_time = float(sys.argv[3])
         max_queue_size = int(sys.argv[4])
+        num_runs = int(sys.argv[5]) if len(sys.argv) == 6 else None
     except ValueError:
-        print("Error: All arguments must be numeric (floats for rates/time, int for queue size)")
+        print("Error: All arguments must be numeric (floats for rates/time, int for queue size and runs)")
         sys.exit(1)
+
+    if num_runs is not None:
+        sim_times = range(10, int(simulation_time) + 1, 10)
+        # An empty batch would overwrite simulation_results.csv with just a header
+        if num_runs < 1 or not sim_times:
+            print("Error: Batch mode needs num_runs >= 1 and simulation_time >= 10")
+            print("Usage: python question1.py <arrival_rate> <service_rate> <simulation_time> <max_queue_size> [num_runs]")
+            sys.exit(1)
+
+        run_batch(arrival_rate, service_rate, sim_times, max_queue_size, num_runs)
+        sys.exit(0)
     
-    main(arrival_rate, service_rate, simulation_time, max_queue_size)
\ No newline at end of file
+    num_customers_served, num_not_served, average_wait_time = main(arrival_rate, service_rate, simulation_time, max_queue_size)
+
+    # Results
+    print(f"Number of customers served: {num_customers_served}")
+    print(f"Number of customers not served: {num_not_served}")
+    print(f"Average wait time: {average_wait_time}")
\ No newline at end of file
@@ -1,35 +1,19 @@
 
 class StatsCollector:
+    """
+    Plain counters for the final report.
+    The event handlers update the fields directly (no per-event method calls).
+    """
+    __slots__ = ('dropped_requests', 'served_requests', 'total_wait_time', 'total_service_time',
+                 'last_departure_time', '_arrival_counter')
+
     def __init__(self):
         self.dropped_requests = 0
         self.served_requests = 0
         self.total_wait_time = 0.0
         self.total_service_time = 0.0
-        self.last_departure_time: float = 0.0
-        self._arrival_counter: int = 0
-
-    def get_next_id(self) -> int:
-        """Generates a unique ID for new requests."""
-        req_id = self._arrival_counter
-        self._arrival_counter += 1
-        return req_id
-
-    def log_drop(self):
-        """Called when a packet encounters a full queue."""
-        self.dropped_requests += 1
-
-    def log_departure(self, wait_time: float, service_time: float, current_time: float):
-        """
-        Called when a packet finishes service.
-        Updates A, Tw sums, Ts sums, and Tend.
-        """
-        self.served_requests += 1
-        self.total_wait_time += wait_time
-        self.total_service_time += service_time
-        
-        # We always update this because time is monotonic. 
-        # The last event processed is by definition the latest time.
-        self.last_departure_time = current_time
+        self.last_departure_time: float = 0.0  # Tend
+        self._arrival_counter: int = 0  # Next request ID
 
     def print_report(self):
         """